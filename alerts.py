@@ -0,0 +1,138 @@
+"""Threshold alert rules over the merged dashboard panel.
+
+Every rule is evaluated for every observation in one vectorized pass, and
+alerts fire on rising edges only: a rule that stays breached does not fire
+again until it has cleared. ``scan_alerts`` advances a small state (last
+date seen, a fingerprint of the rows behind it, which rules are active) so
+callers can persist it and only evaluate new observations on the next run.
+"""
+import numpy as np
+import pandas as pd
+
+from series_cache import fingerprint
+
+# Kind: level -> Column op Threshold
+#       spread -> (Column - Other) op Threshold
+#       pct_change -> % change of Column over Periods op Threshold
+ALERT_RULES = pd.DataFrame([
+    {"Rule": "CPI above 6% tolerance band", "Kind": "level", "Column": "CPI", "Op": ">", "Threshold": 6.0},
+    {"Rule": "CPI below 2% tolerance band", "Kind": "level", "Column": "CPI", "Op": "<", "Threshold": 2.0},
+    {"Rule": "Inverted 3M/10Y yield spread", "Kind": "spread", "Column": "Yield 10Y", "Other": "Yield 3M", "Op": "<", "Threshold": 0.0},
+    {"Rule": "Forex reserves down more than 2%", "Kind": "pct_change", "Column": "Forex Reserves (USD bn)", "Periods": 1, "Op": "<", "Threshold": -2.0},
+    {"Rule": "Call rate above repo rate", "Kind": "spread", "Column": "Call Rate (%)", "Other": "Repo Rate", "Op": ">", "Threshold": 0.0},
+    {"Rule": "Call rate below reverse repo rate", "Kind": "spread", "Column": "Call Rate (%)", "Other": "Reverse Repo Rate", "Op": "<", "Threshold": 0.0},
+    {"Rule": "Food inflation above 6%", "Kind": "level", "Column": "Food Inflation", "Op": ">", "Threshold": 6.0},
+    {"Rule": "USD/INR above 83", "Kind": "level", "Column": "USD/INR", "Op": ">", "Threshold": 83.0},
+    {"Rule": "USD/INR up more than 1%", "Kind": "pct_change", "Column": "USD/INR", "Periods": 1, "Op": ">", "Threshold": 1.0},
+    {"Rule": "Credit growth below 5%", "Kind": "level", "Column": "Credit Growth (%)", "Op": "<", "Threshold": 5.0},
+    {"Rule": "IIP contraction", "Kind": "level", "Column": "IIP (%)", "Op": "<", "Threshold": 0.0},
+])
+
+ALERT_OPS = {">": np.greater, "<": np.less, ">=": np.greater_equal, "<=": np.less_equal}
+ALERT_KINDS = ["level", "spread", "pct_change"]
+ALERT_HISTORY = 100  # fired alerts kept in the state
+
+
+def validate_alert_rules(panel, rules):
+    """Reject rules that name unknown columns, kinds or operators instead of misreading them."""
+    for field in ["Column", "Other"]:
+        names = rules[field].dropna()
+        unknown = names[panel.columns.get_indexer(names) == -1]
+        if len(unknown):
+            raise ValueError(f"Alert rules reference unknown {field} columns: {sorted(set(unknown))}")
+    periods = pd.to_numeric(rules["Periods"], errors="coerce")
+    bad_kind = rules.loc[~rules["Kind"].isin(ALERT_KINDS), "Rule"]
+    bad_op = rules.loc[~rules["Op"].isin(list(ALERT_OPS)), "Rule"]
+    missing_other = rules.loc[(rules["Kind"] == "spread") & rules["Other"].isna(), "Rule"]
+    bad_periods = rules.loc[(rules["Kind"] == "pct_change") & ~((periods >= 1) & (periods % 1 == 0)), "Rule"]
+    for label, bad in [("kind", bad_kind), ("operator", bad_op), ("spread column", missing_other),
+                       ("Periods (need a positive integer)", bad_periods)]:
+        if len(bad):
+            raise ValueError(f"Alert rules with invalid {label}: {list(bad)}")
+
+
+def evaluate_alert_rules(panel, rules):
+    """Operand and breach matrices (observations x rules) for every rule in one vectorized pass.
+
+    Breach is NaN where a rule's inputs were not observed on that row.
+    """
+    validate_alert_rules(panel, rules)
+    values = panel.to_numpy(dtype=float)
+    col = panel.columns.get_indexer(rules["Column"])
+    other = panel.columns.get_indexer(rules["Other"].fillna(rules["Column"]))
+    kind = rules["Kind"].to_numpy()
+    op = rules["Op"].to_numpy()
+
+    base = values[:, col]
+
+    # Change-based rules lag over each series' own observations, not rows of the merged panel
+    lagged = np.full(base.shape, np.nan)
+    change_rules = rules[rules["Kind"] == "pct_change"]
+    for (column, periods), group in change_rules.groupby(["Column", "Periods"]):
+        series = panel[column]
+        lagged[:, rules.index.get_indexer(group.index)] = (
+            series.dropna().shift(int(periods)).reindex(series.index).to_numpy()[:, None]
+        )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        operand = np.select(
+            [kind == "spread", kind == "pct_change"],
+            [base - values[:, other], (base / lagged - 1) * 100],
+            default=base
+        )
+        breached = np.select(
+            [op == symbol for symbol in ALERT_OPS],
+            [compare(operand, rules["Threshold"].to_numpy(dtype=float)) for compare in ALERT_OPS.values()],
+            default=False
+        )
+    return operand, np.where(np.isnan(operand), np.nan, breached)
+
+
+def scan_alerts(panel, rules, state=None):
+    """Evaluate observations after ``state["last_date"]`` and return ``(state, fired)``.
+
+    The rows up to ``last_date`` must still match the stored fingerprint;
+    when they do not (a backfill, or a different data source) the panel is
+    re-evaluated from scratch. ``state`` itself is returned when there is
+    nothing new.
+    """
+    state = state or {}
+    panel = panel.sort_values("Date").reset_index(drop=True)
+    last_date = state.get("last_date")
+    if last_date is not None and fingerprint(panel[panel["Date"] <= last_date]) != state.get("seen"):
+        last_date = None
+    new = panel.index if last_date is None else panel.index[panel["Date"] > last_date]
+    if len(new) == 0:
+        return state, []
+
+    # Start early enough that every change-based rule has its lagged observations
+    validate_alert_rules(panel, rules)
+    start = new[0]
+    for column, periods in rules.loc[rules["Kind"] == "pct_change", ["Column", "Periods"]].itertuples(index=False):
+        observed = np.flatnonzero(panel[column].notna())
+        k = np.searchsorted(observed, new[0])
+        if k:
+            start = min(start, observed[max(k - int(periods), 0)])
+    window = panel.iloc[start:]
+    operand, breached = evaluate_alert_rules(window.drop(columns="Date"), rules)
+    operand, breached = operand[-len(new):], breached[-len(new):]
+    dates = window["Date"].to_numpy()[-len(new):]
+
+    # Rows where a rule's inputs are missing keep that rule's previous state
+    active = state.get("active") if last_date is not None else None
+    active = pd.Series(dtype=bool) if active is None else active
+    previous = active.reindex(rules["Rule"], fill_value=False).to_numpy(dtype=float)
+    states = pd.DataFrame(np.vstack([previous, breached])).ffill().to_numpy(dtype=bool)
+    rising = states[1:] & ~states[:-1]
+
+    fired = [
+        {"Date": pd.Timestamp(dates[t]), "Rule": rules["Rule"].iat[r], "Value": round(float(operand[t, r]), 2)}
+        for t, r in zip(*np.nonzero(rising))
+    ]
+    history = state.get("alerts", []) if last_date is not None else []
+    return {
+        "last_date": pd.Timestamp(dates[-1]),
+        "seen": fingerprint(panel),
+        "active": pd.Series(states[-1], index=rules["Rule"].to_numpy()),
+        "alerts": (history + fired)[-ALERT_HISTORY:]
+    }, fired
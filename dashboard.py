@@ -1,8 +1,18 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import datetime
+import logging
+import os
+import threading
+
+from alerts import ALERT_RULES, scan_alerts
+from dbie_import import CPI_BASKET, CPI_SECTORS, HISTORY_PATH, SCHEMAS, read_history
+from event_study import EVENT_WINDOW, compute_event_study
+from nowcast import NOWCAST_REGRESSORS, BridgeNowcaster, bridge_quarters
+from series_cache import SeriesCache, fingerprint
 
 # -------------------- Page Config --------------------
 st.set_page_config(
@@ -153,6 +163,22 @@ st.sidebar.header("Filters")
 start_date = st.sidebar.date_input("Start Date", datetime.date(2023, 1, 1))
 end_date = st.sidebar.date_input("End Date", datetime.date(2023, 12, 31))
 
+# Policy cycle comparison (e.g. 2018–19 vs 2022–23), aligned on months since cycle start
+compare_mode = st.sidebar.checkbox("Compare Policy Cycles", key="compare_mode")
+compare_windows = []
+if compare_mode:
+    n_windows = st.sidebar.number_input("Number of Cycles", min_value=2, max_value=6, value=2, step=1)
+    for i in range(int(n_windows)):
+        # Distinct defaults: H1/H2 2023, then step back a year per pair of cycles
+        year = 2023 - i // 2
+        default_window = (
+            (datetime.date(year, 1, 1), datetime.date(year, 6, 30)) if i % 2 == 0
+            else (datetime.date(year, 7, 1), datetime.date(year, 12, 31))
+        )
+        window = st.sidebar.date_input(f"Cycle {i + 1}", default_window, key=f"cycle_window_{i}")
+        if len(window) == 2:
+            compare_windows.append(tuple(window))
+
 # Tab 1: Policy Rates
 repo_rate_range = st.sidebar.slider("Repo Rate Range (%)", 0.0, 15.0, (5.0, 8.0), 0.25)
 reverse_repo_range = st.sidebar.slider("Reverse Repo Rate Range (%)", 0.0, 15.0, (5.0, 8.0), 0.25)
@@ -174,6 +200,78 @@ usd_inr_range = st.sidebar.slider("USD/INR Rate", 50.0, 100.0, (70.0, 80.0), 0.1
 gdp_range = st.sidebar.slider("GDP Growth (%)", 0.0, 15.0, (0.0, 10.0), 0.1)
 iip_range = st.sidebar.slider("IIP (%)", -10.0, 20.0, (0.0, 10.0), 0.1)
 
+# -------------------- Persistent Cache --------------------
+@st.cache_resource
+def get_series_cache():
+    """Shared on-disk cache so restarted processes warm up without recomputing."""
+    return SeriesCache()
+
+
+# -------------------- Historical Data --------------------
+history_mtime = os.path.getmtime(HISTORY_PATH) if os.path.exists(HISTORY_PATH) else None
+
+
+@st.cache_data
+def load_history(schema, sample, mtime):
+    """History imported with dbie_import.py when it covers every column, else the sample data.
+
+    ``mtime`` is only there so the cache key changes when the history file does.
+    """
+    history = read_history(schema) if mtime is not None else None
+    if history is None or history[sample.columns].isna().all().any():
+        return sample
+    return history[sample.columns].reset_index(drop=True)
+
+
+# -------------------- Cycle Comparison --------------------
+@st.cache_data
+def cycle_slice(df, start, end, number):
+    """Slice one cycle out of date-sorted history, aligned on months since its start."""
+    lo, hi = df["Date"].searchsorted([pd.Timestamp(start), pd.Timestamp(end) + pd.Timedelta(days=1)])
+    window = df.iloc[lo:hi].copy()
+    window["Months Since Start"] = (
+        (window["Date"].dt.year - start.year) * 12 + (window["Date"].dt.month - start.month)
+    )
+    window["Cycle"] = f"{number}: {start:%b %Y} – {end:%b %Y}"
+    return window
+
+
+def render_cycle_comparison(df, columns, windows, title, container=st):
+    """Overlay every cycle on one chart; each window is cached on its own."""
+    aligned = pd.concat([cycle_slice(df, start, end, i + 1) for i, (start, end) in enumerate(windows)])
+    if aligned.empty:
+        container.info("No data in the selected cycles.")
+        return
+
+    df_long = aligned.melt(
+        id_vars=["Cycle", "Months Since Start"], value_vars=columns,
+        var_name="Indicator", value_name="Value"
+    )
+    fig = px.line(
+        df_long,
+        x="Months Since Start",
+        y="Value",
+        color="Cycle",
+        line_dash="Indicator",
+        markers=True,
+        color_discrete_sequence=["#0277bd", "#ff7043", "#00b0ff", "#4dd0e1", "#01579b", "#81d4fa"],
+        title=title
+    )
+    fig.update_layout(
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        xaxis=dict(title="Months Since Cycle Start", gridcolor="lightgrey", dtick=1),
+        yaxis=dict(gridcolor="lightgrey")
+    )
+    container.plotly_chart(fig, use_container_width=True)
+
+    # Derived metrics per cycle
+    grouped = aligned.groupby("Cycle", sort=False)[columns]
+    first, last = grouped.first(), grouped.last()
+    metrics = pd.concat({"Start": first, "End": last, "Change": last - first, "Peak": grouped.max()}, axis=1)
+    container.dataframe(metrics.round(2), use_container_width=True)
+
+
 # -------------------- Tabs --------------------
 tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
     "Policy Rate Overview", 
@@ -190,13 +288,13 @@ with tab1:
     st.header("Policy Rates Overview")
 
     # Sample Data
-    df_rates = pd.DataFrame({
+    df_rates = load_history("policy_rates", pd.DataFrame({
         "Date": pd.date_range(start="2023-01-01", periods=12, freq="M"),
         "Repo Rate": [6.0, 6.25, 6.25, 6.5, 6.5, 6.75, 6.75, 7.0, 7.0, 7.25, 7.25, 7.5],
         "Reverse Repo Rate": [5.5, 5.75, 5.75, 6.0, 6.0, 6.25, 6.25, 6.5, 6.5, 6.75, 6.75, 7.0],
         "CRR": [4.0]*12,
         "SLR": [18.0]*12
-    })
+    }), history_mtime)
 
     # Filtering
     df_filtered = df_rates[
@@ -232,7 +330,11 @@ with tab1:
         legend=dict(title='Rate Type')
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    if compare_windows:
+        render_cycle_comparison(df_rates, ["Repo Rate", "Reverse Repo Rate"], compare_windows,
+                                "Repo & Reverse Repo Rate by Cycle")
+    else:
+        st.plotly_chart(fig, use_container_width=True)
 
     # ---------------------------
     # KPI CARDS
@@ -287,6 +389,89 @@ with tab1:
     colB.plotly_chart(fig2, use_container_width=True)
 # ---------------------------
 
+# -------------------- CPI Heatmap Engine --------------------
+# Weights per sector come from the CPI basket in dbie_import
+CPI_WEIGHTS = pd.DataFrame(
+    [(sector, group, sub, weight)
+     for group, subs in CPI_BASKET.items() for sub, weights in subs.items()
+     for sector, weight in zip(CPI_SECTORS, weights) if weight],
+    columns=["Sector", "Group", "Sub-group", "Weight"]
+)
+INFLATION_COMPONENTS = ["Food Inflation", "Fuel", "Housing", "Clothing"]
+HEATMAP_LEVELS = ["Category", "Group", "Sub-group"]  # Category = the df_inflation components
+HEATMAP_FREQ = {"Monthly": "M", "Quarterly": "Q", "Yearly": "Y"}
+HEATMAP_TILE_CELLS = 400  # matrices larger than this render as a single image
+
+
+@st.cache_data
+def sample_cpi_basket():
+    """Sample sub-group inflation in the importer's wide cpi_basket layout."""
+    rng = np.random.default_rng(2023)
+    dates = pd.date_range(start="2022-01-01", periods=24, freq="ME")
+    columns = list(SCHEMAS["cpi_basket"])
+    base = rng.uniform(2.0, 8.0, len(columns))
+    drift = rng.normal(0, 0.35, (len(dates), len(columns))).cumsum(axis=0)
+    return pd.DataFrame((base + drift).round(2), columns=columns).assign(Date=dates)[["Date"] + columns]
+
+
+@st.cache_data
+def load_cpi_basket(mtime):
+    """Imported sub-group series that have data, or the sample basket; returns (frame, is_sample).
+
+    Unlike load_history a partial import (one sector, a few sub-groups) is kept
+    rather than replaced, since exports rarely carry the whole basket.
+    """
+    history = read_history("cpi_basket") if mtime is not None else None
+    if history is None or history.drop(columns="Date").isna().all().all():
+        return sample_cpi_basket(), True
+    return history.dropna(axis=1, how="all").reset_index(drop=True), False
+
+
+@st.cache_data
+def cpi_basket_long(df_wide):
+    """Long Date / Sector / Group / Sub-group / Weight / Inflation frame from the wide series."""
+    df = df_wide.melt(id_vars="Date", var_name="Series", value_name="Inflation").dropna(subset=["Inflation"])
+    df[["Sector", "Sub-group"]] = df["Series"].str.split(": ", n=1, expand=True)
+    return df.drop(columns="Series").merge(CPI_WEIGHTS, on=["Sector", "Sub-group"])
+
+
+@st.cache_data
+def cpi_heatmap_matrix(df_basket, level, sector, freq):
+    """Weighted period x component matrix for one aggregation level / sector / frequency."""
+    df = df_basket if sector == "All" else df_basket[df_basket["Sector"] == sector]
+    keys = [df["Date"].dt.to_period(freq).rename("Period"), df[level]]
+    if sector == "All":
+        keys.insert(1, df["Sector"])
+
+    weighted = df[["Weight"]].assign(Value=df["Inflation"] * df["Weight"])
+    sums = weighted.groupby(keys, sort=True).sum()
+    matrix = (sums["Value"] / sums["Weight"]).unstack(keys[0].name).T
+    if sector == "All":
+        matrix.columns = [f"{sec} · {item}" for sec, item in matrix.columns]
+    return matrix
+
+
+def heatmap_tile(matrix):
+    """Render a matrix as one compressed image instead of per-cell heatmap shapes."""
+    lut = np.array([
+        [int(c) for c in color[4:-1].split(",")]
+        for color in px.colors.sample_colorscale("Blues", np.linspace(0, 1, 256))
+    ], dtype=np.uint8)
+    values = matrix.T.to_numpy(dtype=float)
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    scaled = np.nan_to_num((values - lo) / max(hi - lo, 1e-9) * 255, nan=0).astype(np.uint8)
+    rgb = lut[scaled]
+    rgb[np.isnan(values)] = 255
+
+    fig = px.imshow(rgb, binary_string=True, aspect="auto")
+    x_step = max(len(matrix.index) // 24, 1)
+    fig.update_xaxes(tickvals=list(range(0, len(matrix.index), x_step)),
+                     ticktext=[str(p) for p in matrix.index[::x_step]])
+    fig.update_yaxes(tickvals=list(range(len(matrix.columns))), ticktext=list(matrix.columns))
+    fig.update_layout(title=f"Scale: {lo:.1f}% (light) – {hi:.1f}% (dark)", height=max(400, 18 * len(matrix.columns)))
+    return fig
+
+
 # -------------------- Tab 2: Inflation Dashboard --------------------
 with tab2:
     st.header("Inflation Dashboard")
@@ -294,7 +479,7 @@ with tab2:
     # ------------------------
     # SAMPLE DATA
     # ------------------------
-    df_inflation = pd.DataFrame({
+    df_inflation = load_history("inflation", pd.DataFrame({
         "Date": pd.date_range(start="2023-01-01", periods=12, freq="M"),
         "CPI": [5.0,5.1,5.2,5.0,5.3,5.4,5.5,5.2,5.1,5.0,4.9,4.8],
         "WPI": [3.5,3.6,3.7,3.6,3.5,3.4,3.5,3.6,3.7,3.6,3.5,3.4],
@@ -302,7 +487,7 @@ with tab2:
         "Fuel": [3.1, 3.0, 2.9, 2.8, 3.0, 3.2, 3.1, 3.0, 3.2, 3.1, 3.0, 2.9],
         "Housing": [4.6,4.7,4.6,4.8,4.7,4.6,4.7,4.6,4.8,4.7,4.6,4.5],
         "Clothing": [3.5,3.6,3.4,3.5,3.6,3.7,3.5,3.4,3.5,3.6,3.7,3.5],
-    })
+    }), history_mtime)
 
     # ------------------------
     # FILTER DATA
@@ -340,7 +525,11 @@ with tab2:
         labels={"value": "Inflation (%)", "variable": "Category"}
     )
     fig1.update_layout(plot_bgcolor="white", paper_bgcolor="white", title="CPI vs WPI")
-    col1_chart.plotly_chart(fig1, use_container_width=True)
+    if compare_windows:
+        render_cycle_comparison(df_inflation, ["CPI", "WPI"], compare_windows,
+                                "CPI vs WPI by Cycle", container=col1_chart)
+    else:
+        col1_chart.plotly_chart(fig1, use_container_width=True)
 
     # ---------------------------------------------------
     # FOOD INFLATION BAR CHART
@@ -421,16 +610,47 @@ with tab2:
     # ---------------------------------------------------
     st.subheader("Inflation Category Heatmap")
 
-    heatmap_data = df_filtered[["Food Inflation", "Fuel", "Housing", "Clothing"]]
-    heatmap_data.index = df_filtered["Date"].dt.strftime("%b")
-
-    fig6 = px.imshow(
-        heatmap_data.T,
-        color_continuous_scale="Blues",
-        aspect="auto"
+    colH1, colH2, colH3 = st.columns(3)
+    heat_level = colH1.selectbox("Component Level", HEATMAP_LEVELS, key="tab2_heat_level")
+    heat_sector = colH2.selectbox(
+        "Sector", CPI_SECTORS + ["All"], key="tab2_heat_sector", disabled=heat_level == "Category",
+        help="Category components are all-India series; sectors apply to CPI groups and sub-groups"
     )
-    fig6.update_layout(plot_bgcolor="white", paper_bgcolor="white")
-    st.plotly_chart(fig6, use_container_width=True)
+    heat_freq = colH3.selectbox("Frequency", list(HEATMAP_FREQ), key="tab2_heat_freq")
+
+    if heat_level == "Category":
+        # Headline components follow every sidebar filter, like the charts above
+        periods = df_filtered["Date"].dt.to_period(HEATMAP_FREQ[heat_freq]).rename("Period")
+        heatmap_data = df_filtered[INFLATION_COMPONENTS].groupby(periods).mean()
+    else:
+        # Full-history basket matrix is cached per level/sector/frequency; the date window only slices it
+        df_basket_wide, basket_is_sample = load_cpi_basket(history_mtime)
+        if basket_is_sample:
+            st.caption("Showing sample CPI basket data; import sub-group series with dbie_import.py to replace it.")
+        elif df_basket_wide.shape[1] - 1 < len(SCHEMAS["cpi_basket"]):
+            st.caption(f"Imported CPI basket covers {df_basket_wide.shape[1] - 1} of {len(SCHEMAS['cpi_basket'])} "
+                       "sector sub-groups; groups are weighted over the sub-groups present.")
+        df_basket = cpi_basket_long(df_basket_wide)
+        matrix = cpi_heatmap_matrix(df_basket, heat_level, heat_sector, HEATMAP_FREQ[heat_freq])
+        periods = matrix.index
+        heatmap_data = matrix[
+            (periods.end_time.date >= start_date) & (periods.start_time.date <= end_date)
+        ]
+
+    if heatmap_data.empty:
+        st.info("No CPI component data for the selected sector and date range.")
+    elif heatmap_data.size > HEATMAP_TILE_CELLS:
+        fig6 = heatmap_tile(heatmap_data)
+        fig6.update_layout(plot_bgcolor="white", paper_bgcolor="white")
+        st.plotly_chart(fig6, use_container_width=True)
+    else:
+        fig6 = px.imshow(
+            heatmap_data.T.set_axis(heatmap_data.index.astype(str), axis=1),
+            color_continuous_scale="Blues",
+            aspect="auto"
+        )
+        fig6.update_layout(plot_bgcolor="white", paper_bgcolor="white")
+        st.plotly_chart(fig6, use_container_width=True)
 
     # ---------------------------------------------------
     # AUTO SUMMARY
@@ -454,7 +674,7 @@ with tab3:
     # ---------------------------------------------------------
     # SAMPLE DATA (Matches theme + clean structure)
     # ---------------------------------------------------------
-    df_liquidity = pd.DataFrame({
+    df_liquidity = load_history("liquidity", pd.DataFrame({
         "Date": pd.date_range(start="2023-01-01", periods=12, freq="M"),
         "Liquidity (₹ Cr)": [500000,520000,510000,530000,540000,550000,560000,570000,580000,590000,600000,610000],
         "Credit Growth (%)": [7.0,7.2,7.1,7.3,7.5,7.6,7.8,7.7,7.9,8.0,8.2,8.3],
@@ -465,7 +685,7 @@ with tab3:
         "Yield 1Y": [6.4,6.4,6.5,6.5,6.6,6.6,6.7,6.7,6.8,6.8,6.9,7.0],
         "Yield 5Y": [7.0,7.0,7.1,7.1,7.2,7.3,7.3,7.4,7.5,7.5,7.6,7.7],
         "Yield 10Y": [7.3,7.3,7.4,7.5,7.5,7.6,7.7,7.7,7.8,7.9,7.9,8.0]
-    })
+    }), history_mtime)
 
     # ---------------------------------------------------------
     # FILTER
@@ -500,7 +720,11 @@ with tab3:
     )
     fig1.update_layout(title="Liquidity vs Credit Growth Trend",
                        paper_bgcolor="white", plot_bgcolor="white")
-    st.plotly_chart(fig1, use_container_width=True)
+    if compare_windows:
+        render_cycle_comparison(df_liquidity, ["Liquidity (₹ Cr)", "Credit Growth (%)"], compare_windows,
+                                "Liquidity vs Credit Growth by Cycle")
+    else:
+        st.plotly_chart(fig1, use_container_width=True)
 
     # ---------------------------------------------------------
     # MONEY SUPPLY TRENDS (M1 & M3)
@@ -570,11 +794,11 @@ with tab4:
     st.header("Forex Reserves & USD/INR")
 
     # Data
-    df_forex = pd.DataFrame({
+    df_forex = load_history("forex", pd.DataFrame({
         "Date": pd.date_range(start="2023-01-01", periods=12, freq="M"),
         "Forex Reserves (USD bn)": [600,605,610,615,620,625,630,635,640,645,650,655],
         "USD/INR": [75.0,75.2,75.5,75.3,75.1,74.9,75.0,75.2,75.4,75.3,75.5,75.6]
-    })
+    }), history_mtime)
 
     # Filter
     df_filtered = df_forex[
@@ -606,7 +830,11 @@ with tab4:
         paper_bgcolor="white",
         legend_title_text=""
     )
-    st.plotly_chart(fig, use_container_width=True)
+    if compare_windows:
+        render_cycle_comparison(df_forex, ["Forex Reserves (USD bn)", "USD/INR"], compare_windows,
+                                "Forex Reserves & USD/INR by Cycle")
+    else:
+        st.plotly_chart(fig, use_container_width=True)
 
     # --- Scatter Plot (Correlation) WITHOUT statsmodels
     fig_scatter = px.scatter(
@@ -639,16 +867,22 @@ with tab4:
     st.dataframe(summary, use_container_width=True)
 
 
+# -------------------- Nowcasting Engine --------------------
+@st.cache_resource
+def get_nowcaster():
+    return BridgeNowcaster()
+
+
 # -------------------- Tab 5: Economic Indicators --------------------
 with tab5:
     st.header("📊 Economic Indicators")
 
     # Sample Economic Data
-    df_econ = pd.DataFrame({
+    df_econ = load_history("econ", pd.DataFrame({
         "Date": pd.date_range(start="2023-01-01", periods=12, freq="M"),
         "GDP Growth (%)": [6.0, 6.1, 6.2, 6.0, 5.9, 6.0, 6.1, 6.2, 6.3, 6.1, 6.0, 5.9],
         "IIP (%)": [4.0, 4.1, 4.2, 4.0, 3.9, 4.0, 4.1, 4.2, 4.3, 4.1, 4.0, 3.9]
-    })
+    }), history_mtime)
 
     # Apply Filters
     df_filtered = df_econ[
@@ -697,7 +931,11 @@ with tab5:
         legend_title="Indicators"
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    if compare_windows:
+        render_cycle_comparison(df_econ, ["GDP Growth (%)", "IIP (%)"], compare_windows,
+                                "GDP Growth vs IIP by Cycle")
+    else:
+        st.plotly_chart(fig, use_container_width=True)
 
     # Summary Table
     st.markdown("### 📘 Summary Table")
@@ -710,6 +948,85 @@ with tab5:
         })
     )
 
+    # ---------------------------------------------------
+    # GDP NOWCAST (BRIDGE REGRESSIONS)
+    # ---------------------------------------------------
+    st.subheader("GDP Nowcast (Bridge Model)")
+
+    df_monthly = pd.merge(
+        df_econ, df_liquidity[["Date", "Credit Growth (%)", "M3", "Call Rate (%)"]], on="Date", how="inner"
+    ).sort_values("Date")
+    X_q, y_q, months_q = bridge_quarters(df_monthly)
+
+    # Quarters without a GDP print are nowcast; every quarter with one is training data
+    quarters = pd.concat([X_q, y_q], axis=1).dropna(subset=NOWCAST_REGRESSORS)
+    released = quarters["GDP Growth (%)"].notna()
+    train, pending = quarters[released], quarters.index[~released]
+
+    if len(train) < 2:
+        st.info("Need at least two released quarters to fit the nowcast.")
+    else:
+        nowcaster = get_nowcaster()
+        nowcaster.sync(train[NOWCAST_REGRESSORS].to_numpy(), train["GDP Growth (%)"].to_numpy())
+        gdp_nowcast, best_spec, spec_rmse, backtest_pred, backtest_idx = nowcaster.nowcast(
+            quarters.loc[pending, NOWCAST_REGRESSORS].to_numpy()
+        )
+
+        col1, col2, col3 = st.columns(3)
+        if len(pending):
+            col1.metric(f"GDP Nowcast {pending[-1]}", f"{gdp_nowcast[-1]:.2f}%")
+            col2.metric("Months Observed", f"{months_q.loc[pending[-1]]} / 3")
+        else:
+            col1.metric("GDP Nowcast", "n/a")
+            col2.metric("Latest GDP Release", str(train.index[-1]))
+        col3.metric("Backtest RMSE", "n/a" if np.isnan(spec_rmse[best_spec]) else f"{spec_rmse[best_spec]:.2f}")
+        st.caption(f"Selected specification: {nowcaster.spec_name(best_spec)}"
+                   + ("" if len(pending) else " · every quarter has a released GDP figure, so there is nothing to nowcast"))
+
+        # Origins where the selected spec had no more quarters than parameters are not backtested
+        backtested = ~np.isnan(backtest_pred)
+        fig_nowcast = go.Figure()
+        fig_nowcast.add_trace(go.Scatter(
+            x=train.index.astype(str), y=train["GDP Growth (%)"],
+            mode="lines+markers", name="GDP Growth (%)", line=dict(color="#0288d1")
+        ))
+        fig_nowcast.add_trace(go.Scatter(
+            x=train.index[backtest_idx[backtested]].astype(str), y=backtest_pred[backtested],
+            mode="lines+markers", name="Backtest", line=dict(color="#81d4fa", dash="dot")
+        ))
+        fig_nowcast.add_trace(go.Scatter(
+            x=pending.astype(str), y=gdp_nowcast,
+            mode="markers", name="Nowcast", marker=dict(color="#ff7043", size=12)
+        ))
+        fig_nowcast.update_layout(
+            plot_bgcolor="white",
+            paper_bgcolor="white",
+            title="Quarterly GDP Growth: Actual, Backtest & Nowcast",
+            xaxis=dict(title="Quarter", gridcolor="lightgrey"),
+            yaxis=dict(title="GDP Growth (%)", gridcolor="lightgrey")
+        )
+        st.plotly_chart(fig_nowcast, use_container_width=True)
+
+        spec_table = pd.DataFrame({
+            "Specification": [nowcaster.spec_name(s) for s in range(len(spec_rmse))],
+            "Backtest RMSE": spec_rmse
+        }).sort_values("Backtest RMSE").head(5)
+        st.dataframe(spec_table.round(3), hide_index=True, use_container_width=True)
+
+
+# -------------------- Event Study Engine --------------------
+EVENT_STUDY_VERSION = 3
+
+
+@st.cache_data
+def build_event_study(df_events, df_market, window=EVENT_WINDOW):
+    """Event study results, served from the persistent cache when inputs are unchanged."""
+    params = {"data": fingerprint(df_events, df_market), "window": window}
+    return get_series_cache().get_or_compute(
+        "event_study", EVENT_STUDY_VERSION, params,
+        lambda: compute_event_study(df_events, df_market, window)
+    )
+
 
 # -------------------- Tab 6: RBI Announcements --------------------
 
@@ -739,6 +1056,10 @@ with tab6:
         ]
     })
 
+    # Precomputed transmission profiles (unfiltered, indexed by announcement)
+    df_market = pd.merge(df_liquidity, df_forex, on="Date", how="outer")
+    event_study = build_event_study(df_announcements, df_market)
+
     # Filtering by date
     df_filtered = df_announcements[
         (df_announcements["Date"].dt.date >= start_date) &
@@ -776,7 +1097,7 @@ with tab6:
     # Create colored announcement feed
     st.subheader("📢 RBI Policy Feed")
 
-    for _, row in df_filtered.iterrows():
+    for event_id, row in df_filtered.iterrows():
         color = "#0288d1" if row["Impact"] == "Increase" else (
             "#4dd0e1" if row["Impact"] == "Decrease" else "#81d4fa"
         )
@@ -797,6 +1118,47 @@ with tab6:
             """,
             unsafe_allow_html=True
         )
+        if st.button("Show transmission", key=f"tab6_event_{event_id}"):
+            st.session_state["tab6_event"] = event_id
+
+    st.markdown("---")
+
+    # ---------------------------------------------------
+    # POLICY TRANSMISSION (EVENT STUDY)
+    # ---------------------------------------------------
+    st.subheader("Policy Transmission")
+
+    event_id = st.session_state.get("tab6_event")
+    if event_id in df_filtered.index and event_study["profiles"].loc[[event_id], "Cumulative Pass-through"].isna().all():
+        st.info("Insufficient market data around this announcement to measure transmission.")
+    elif event_id in df_filtered.index:
+        event = df_announcements.loc[event_id]
+        profile = event_study["profiles"].loc[[event_id]]
+
+        fig_event = px.line(
+            profile,
+            x="Offset",
+            y="Cumulative Pass-through",
+            color="Series",
+            markers=True,
+            color_discrete_sequence=["#0277bd", "#00b0ff", "#4dd0e1", "#81d4fa", "#01579b"],
+            title=f"{event['Announcement']} ({event['Date'].strftime('%d %b %Y')})"
+        )
+        fig_event.update_layout(
+            plot_bgcolor="white",
+            paper_bgcolor="white",
+            xaxis=dict(title="Periods since announcement", gridcolor="lightgrey", dtick=1),
+            yaxis=dict(title="Cumulative abnormal move", gridcolor="lightgrey")
+        )
+        st.plotly_chart(fig_event, use_container_width=True)
+    else:
+        st.info("Select an announcement above to view its transmission profile.")
+
+    colC, colD = st.columns(2)
+    colC.markdown("**Avg Pass-through by Category**")
+    colC.dataframe(event_study["by_category"].round(3), use_container_width=True)
+    colD.markdown("**Avg Pass-through by Impact**")
+    colD.dataframe(event_study["by_impact"].round(3), use_container_width=True)
 
     st.markdown("---")
 
@@ -804,6 +1166,51 @@ with tab6:
     st.subheader("Summary Table")
     st.dataframe(df_filtered.style.background_gradient(cmap="Blues"))
 
+# -------------------- Alert Engine --------------------
+ALERT_LOG = "alerts.log"
+ALERT_STATE_VERSION = 2
+
+
+@st.cache_resource
+def get_alert_state():
+    """Edge-trigger state shared by all sessions and restored from the persistent cache."""
+    logger = logging.getLogger("rbi_dashboard.alerts")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.FileHandler(ALERT_LOG)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+
+    saved = get_series_cache().get("alert_state", ALERT_STATE_VERSION) or {}
+    return {"lock": threading.Lock(), "saved": saved, "logger": logger}
+
+
+def run_alerts(panel, rules):
+    """Evaluate rules over observations not seen yet, log rising edges and persist the state."""
+    state = get_alert_state()
+    with state["lock"]:
+        saved, fired = scan_alerts(panel, rules, state["saved"])
+        if saved is not state["saved"]:
+            for alert in fired:
+                state["logger"].info("%s | %s | %s", alert["Date"].date(), alert["Rule"], alert["Value"])
+            state["saved"] = saved
+            get_series_cache().put("alert_state", ALERT_STATE_VERSION, None, saved)
+        return saved.get("alerts", [])
+
+
+df_panel = df_rates
+for df_part in [df_inflation, df_liquidity, df_forex, df_econ]:
+    df_panel = pd.merge(df_panel, df_part, on="Date", how="outer")
+
+alerts = run_alerts(df_panel, ALERT_RULES)
+
+st.sidebar.header("Alerts")
+if alerts:
+    for alert in reversed(alerts[-10:]):
+        st.sidebar.warning(f"**{alert['Date'].strftime('%d %b %Y')}** · {alert['Rule']} ({alert['Value']})")
+else:
+    st.sidebar.success("No alerts triggered")
+
 # Apply CSS to style the sidebar
 st.markdown("""
     <style>
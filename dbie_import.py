@@ -0,0 +1,308 @@
+"""Streaming importer for RBI Database on Indian Economy (DBIE) bulk exports.
+
+Reads CSV or Excel dumps in bounded-memory chunks, maps the source columns
+onto the dashboard's datasets (policy rates, inflation, liquidity & yields,
+forex, economic indicators, CPI sub-groups by sector) and upserts them by date into a local SQLite
+history file that dashboard.py picks up in place of its sample data.
+
+    python dbie_import.py dbie_export.csv --chunksize 50000
+    python dbie_import.py handbook.xlsx --sheet "Table 2" --skiprows 4
+
+Exports are expected in wide layout: one date column plus one column per
+indicator. Headers that the alias table does not recognise can be mapped
+with ``--map "Source Header=Dashboard Column"``; CPI sub-group columns are
+named ``"<Sector>: <Sub-group>"``, e.g. ``"Rural: Cereals and products"``. Dates are read as ISO
+(YYYY-MM-DD) first and day-first otherwise; pass ``--date-format`` when an
+export uses anything else.
+"""
+import argparse
+import logging
+import os
+import re
+import sqlite3
+import time
+
+import pandas as pd
+
+HISTORY_PATH = os.environ.get("RBI_HISTORY_PATH", "rbi_history.sqlite")
+MAX_BAD_DATE_SHARE = 0.5     # reject a chunk when more of its dates than this fail to parse
+MAX_DATE_DISORDER = 0.1      # warn when this share of date steps runs against the chunk's order
+
+_LOG = logging.getLogger(__name__)
+
+DATE_ALIASES = ["date", "period", "month", "week ended", "fortnight ended", "as on", "year month"]
+
+# Dashboard column -> source header aliases (compared after normalisation)
+SCHEMAS = {
+    "policy_rates": {
+        "Repo Rate": ["policy repo rate", "repo rate", "repo"],
+        "Reverse Repo Rate": ["fixed reverse repo rate", "reverse repo rate", "reverse repo"],
+        "CRR": ["cash reserve ratio", "crr"],
+        "SLR": ["statutory liquidity ratio", "slr"],
+    },
+    "inflation": {
+        "CPI": ["cpi", "cpi combined", "cpi inflation", "all india cpi inflation", "consumer price index combined"],
+        "WPI": ["wpi", "wpi inflation", "wholesale price index", "wpi all commodities"],
+        "Food Inflation": ["food inflation", "cfpi", "consumer food price index", "food and beverages"],
+        "Fuel": ["fuel", "fuel and light"],
+        "Housing": ["housing"],
+        "Clothing": ["clothing", "clothing and footwear"],
+    },
+    "liquidity": {
+        "Liquidity (₹ Cr)": ["liquidity", "net liquidity", "net laf", "liquidity adjustment facility"],
+        "Credit Growth (%)": ["credit growth", "bank credit growth", "non food credit growth"],
+        "Call Rate (%)": ["call rate", "call money rate", "weighted average call rate", "wacr"],
+        "M1": ["m1", "narrow money"],
+        "M3": ["m3", "broad money"],
+        "Yield 3M": ["yield 3m", "91 day t bill", "91 day treasury bill", "91 day t bill yield"],
+        "Yield 1Y": ["yield 1y", "364 day t bill", "364 day treasury bill", "1 year g sec yield"],
+        "Yield 5Y": ["yield 5y", "5 year g sec", "5 year g sec yield"],
+        "Yield 10Y": ["yield 10y", "10 year g sec", "10 year g sec yield", "10 year benchmark yield"],
+    },
+    "forex": {
+        "Forex Reserves (USD bn)": ["forex reserves", "foreign exchange reserves", "total reserves"],
+        "USD/INR": ["usd inr", "inr usd", "rupee us dollar", "fbil reference rate usd"],
+    },
+    "econ": {
+        "GDP Growth (%)": ["gdp growth", "real gdp growth", "gdp"],
+        "IIP (%)": ["iip", "iip growth", "index of industrial production"],
+    },
+}
+
+# CPI basket: group -> {sub-group: (Combined, Rural, Urban) weights, base 2012}.
+# Rural housing is not compiled, so it has zero weight and no series.
+CPI_SECTORS = ["Combined", "Rural", "Urban"]
+CPI_BASKET = {
+    "Food and beverages": {
+        "Cereals and products": (9.67, 12.35, 6.59), "Meat and fish": (3.61, 4.38, 2.73),
+        "Egg": (0.43, 0.49, 0.36), "Milk and products": (6.61, 7.72, 5.33),
+        "Oils and fats": (3.56, 4.21, 2.81), "Fruits": (2.89, 2.88, 2.90),
+        "Vegetables": (6.04, 7.46, 4.41), "Pulses and products": (2.38, 2.95, 1.73),
+        "Sugar and confectionery": (1.36, 1.70, 0.97), "Spices": (2.50, 3.11, 1.79),
+        "Non-alcoholic beverages": (1.26, 1.37, 1.13), "Prepared meals, snacks, sweets": (5.55, 5.56, 5.54),
+    },
+    "Pan, tobacco and intoxicants": {"Pan, tobacco and intoxicants": (2.38, 3.26, 1.36)},
+    "Clothing and footwear": {"Clothing": (5.58, 6.32, 4.72), "Footwear": (0.95, 1.04, 0.85)},
+    "Housing": {"Housing": (10.07, 0.0, 21.67)},
+    "Fuel and light": {"Fuel and light": (6.84, 7.94, 5.58)},
+    "Miscellaneous": {
+        "Household goods and services": (3.80, 3.75, 3.87), "Health": (5.89, 6.83, 4.81),
+        "Transport and communication": (8.59, 7.60, 9.73), "Recreation and amusement": (1.68, 1.37, 2.04),
+        "Education": (4.46, 3.46, 5.62), "Personal care and effects": (3.89, 4.25, 3.47),
+    },
+}
+
+# Sub-group inflation by sector, one "<Sector>: <Sub-group>" column per weighted series
+SCHEMAS["cpi_basket"] = {
+    f"{sector}: {sub}": [f"cpi {sector} {sub}", f"{sector} {sub}", f"{sub} {sector}"]
+    for subs in CPI_BASKET.values()
+    for sub, weights in subs.items()
+    for sector, weight in zip(CPI_SECTORS, weights) if weight
+}
+
+
+# -------------------- Column Mapping --------------------
+def normalize(header):
+    """Lower-case, drop unit suffixes in brackets and non-alphanumerics."""
+    header = re.sub(r"[\(\[].*?[\)\]]", " ", str(header).lower())
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", header).split())
+
+
+def resolve_columns(headers, overrides=None):
+    """Map source headers to the date column and to (schema, column) targets."""
+    lookup = {}
+    for schema, columns in SCHEMAS.items():
+        for column, aliases in columns.items():
+            for alias in [column] + aliases:
+                lookup.setdefault(normalize(alias), (schema, column))
+    overrides = {normalize(k): v for k, v in (overrides or {}).items()}
+
+    date_col, targets = None, {}
+    for header in headers:
+        key = normalize(header)
+        if date_col is None and key in DATE_ALIASES:
+            date_col = header
+        elif key in overrides:
+            column = overrides[key]
+            schema = next((s for s, cols in SCHEMAS.items() if column in cols), None)
+            if schema is None:
+                raise ValueError(f"--map target {column!r} is not a dashboard column")
+            targets[header] = (schema, column)
+        elif key in lookup and lookup[key] not in targets.values():
+            targets[header] = lookup[key]
+
+    if date_col is None:
+        raise ValueError(f"No date column found; expected one of {DATE_ALIASES}")
+    return date_col, targets
+
+
+# -------------------- Pipeline --------------------
+def read_chunks(path, chunksize, sheet=None, skiprows=0):
+    """Yield raw DataFrame chunks without loading the whole file."""
+    if path.lower().endswith(".xls"):
+        raise ValueError(f"{path}: legacy .xls workbooks are not supported; re-save as .xlsx or CSV")
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        rows = workbook[sheet].iter_rows(values_only=True) if sheet else workbook.active.iter_rows(values_only=True)
+        for _ in range(skiprows):
+            next(rows, None)
+        header = [str(h).strip() if h is not None else f"Unnamed {i}" for i, h in enumerate(next(rows))]
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunksize:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+        workbook.close()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, skiprows=skiprows, dtype=str, skipinitialspace=True)
+
+
+def parse_dates(raw, date_format=None, dayfirst=True):
+    """Parse a date column: explicit format if given, else ISO first, then day/month order."""
+    if date_format:
+        return pd.to_datetime(raw, format=date_format, errors="coerce")
+    dates = pd.to_datetime(raw, format="ISO8601", errors="coerce")
+    rest = dates.isna() & raw.notna()
+    if rest.any():
+        dates[rest] = pd.to_datetime(raw[rest], format="mixed", dayfirst=dayfirst, errors="coerce")
+    return dates
+
+
+def check_dates(raw, dates):
+    """Reject chunks whose dates mostly fail to parse; warn when they come back out of order."""
+    present = raw.notna() & (raw.astype(str).str.strip() != "")
+    failed = (dates.isna() & present).sum()
+    if present.sum() and failed / present.sum() > MAX_BAD_DATE_SHARE:
+        raise ValueError(
+            f"{failed} of {present.sum()} dates failed to parse (e.g. {raw[dates.isna() & present].iloc[0]!r}); "
+            "pass --date-format"
+        )
+    steps = dates.dropna().diff().dropna()
+    ups, downs = (steps > pd.Timedelta(0)).sum(), (steps < pd.Timedelta(0)).sum()
+    if ups + downs and min(ups, downs) / (ups + downs) > MAX_DATE_DISORDER:
+        _LOG.warning("Dates in chunk are out of order (%d forward, %d backward steps); "
+                     "check the day/month order or pass --date-format", ups, downs)
+
+
+def map_chunks(chunks, overrides=None, dayfirst=True, date_format=None):
+    """Yield (schema, frame) pairs with a parsed Date and numeric dashboard columns."""
+    date_col, targets = None, None
+    for chunk in chunks:
+        if targets is None:
+            date_col, targets = resolve_columns(chunk.columns, overrides)
+        dates = parse_dates(chunk[date_col], date_format, dayfirst)
+        check_dates(chunk[date_col], dates)
+
+        for schema in SCHEMAS:
+            sources = [src for src, (s, _) in targets.items() if s == schema]
+            if not sources:
+                continue
+            frame = chunk[sources].apply(
+                lambda col: pd.to_numeric(col.astype(str).str.replace(",", "").str.strip(), errors="coerce")
+            )
+            frame.columns = [targets[src][1] for src in sources]
+            frame.insert(0, "Date", dates)
+            yield schema, frame
+
+
+def dedupe(mapped):
+    """Drop undated rows and collapse repeated dates within a chunk (last value wins)."""
+    for schema, frame in mapped:
+        frame = frame.dropna(subset=["Date"])
+        frame = frame.dropna(how="all", subset=frame.columns[1:])
+        if not frame.empty:
+            yield schema, frame.groupby("Date", sort=True).last().reset_index()
+
+
+# -------------------- History Store --------------------
+def connect(path=HISTORY_PATH):
+    conn = sqlite3.connect(path)
+    for schema, columns in SCHEMAS.items():
+        cols = ", ".join(f'"{c}" REAL' for c in columns)
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{schema}" ("Date" TEXT PRIMARY KEY, {cols})')
+    return conn
+
+
+def upsert(conn, schema, frame):
+    """Insert or update by Date; columns missing from this chunk keep their stored value."""
+    columns = list(frame.columns[1:])
+    names = ", ".join(f'"{c}"' for c in ["Date"] + columns)
+    updates = ", ".join(f'"{c}" = COALESCE(excluded."{c}", "{schema}"."{c}")' for c in columns)
+    rows = zip(
+        frame["Date"].dt.strftime("%Y-%m-%d"),
+        *[frame[c].astype(object).where(frame[c].notna(), None) for c in columns]
+    )
+    conn.executemany(
+        f'INSERT INTO "{schema}" ({names}) VALUES ({", ".join("?" * (len(columns) + 1))}) '
+        f'ON CONFLICT("Date") DO UPDATE SET {updates}',
+        rows
+    )
+    return len(frame)
+
+
+def read_history(schema, path=HISTORY_PATH):
+    """Imported history for one dataset, or None when nothing has been imported."""
+    if not os.path.exists(path):
+        return None
+    with sqlite3.connect(path) as conn:
+        try:
+            df = pd.read_sql_query(f'SELECT * FROM "{schema}" ORDER BY "Date"', conn, parse_dates=["Date"])
+        except pd.errors.DatabaseError:
+            return None
+    return df if not df.empty else None
+
+
+def import_file(path, db_path=HISTORY_PATH, chunksize=50_000, sheet=None, skiprows=0,
+                overrides=None, dayfirst=True, date_format=None, report=print):
+    """Stream one export into the history store and return rows upserted per dataset."""
+    conn = connect(db_path)
+    counts = {schema: 0 for schema in SCHEMAS}
+    source_rows, started = 0, time.perf_counter()
+    try:
+        for chunk in read_chunks(path, chunksize, sheet=sheet, skiprows=skiprows):
+            source_rows += len(chunk)
+            with conn:
+                for schema, frame in dedupe(map_chunks([chunk], overrides, dayfirst, date_format)):
+                    counts[schema] += upsert(conn, schema, frame)
+            elapsed = time.perf_counter() - started
+            report(f"{source_rows:>12,} rows  {source_rows / elapsed:>12,.0f} rows/sec")
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    report(f"Imported {source_rows:,} rows in {elapsed:.1f}s ({source_rows / max(elapsed, 1e-9):,.0f} rows/sec)")
+    for schema, count in counts.items():
+        if count:
+            report(f"  {schema:<14} {count:>12,} rows upserted")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import RBI DBIE bulk CSV/Excel exports into the dashboard history")
+    parser.add_argument("files", nargs="+", help="CSV or .xlsx export files")
+    parser.add_argument("--db", default=HISTORY_PATH, help="history SQLite file (default: %(default)s)")
+    parser.add_argument("--chunksize", type=int, default=50_000, help="rows per chunk (bounds memory)")
+    parser.add_argument("--sheet", help="Excel sheet name (default: first sheet)")
+    parser.add_argument("--skiprows", type=int, default=0, help="preamble rows before the header")
+    parser.add_argument("--date-format", help="strftime format of the date column, e.g. %%d-%%b-%%Y")
+    parser.add_argument("--monthfirst", action="store_true",
+                        help="parse non-ISO dates as month/day instead of day/month")
+    parser.add_argument("--map", action="append", default=[], metavar="SOURCE=TARGET",
+                        help="map a source header onto a dashboard column")
+    args = parser.parse_args()
+
+    overrides = dict(item.split("=", 1) for item in args.map)
+    for path in args.files:
+        print(f"Importing {path}")
+        import_file(path, db_path=args.db, chunksize=args.chunksize, sheet=args.sheet,
+                    skiprows=args.skiprows, overrides=overrides, dayfirst=not args.monthfirst,
+                    date_format=args.date_format)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Event study of policy transmission around RBI announcements.
+
+Each announcement is aligned to the market series with one searchsorted and
+one fancy-index gather. Abnormal moves are period changes net of the
+pre-announcement drift; their running sum is the cumulative pass-through,
+reported per announcement and averaged per category and impact tag.
+Offsets that fall outside the market history are missing rather than
+padded, so announcements without enough data drop out of the averages.
+"""
+import numpy as np
+import pandas as pd
+
+EVENT_WINDOW = 2  # observations either side of an announcement
+EVENT_SERIES = ["Call Rate (%)", "Yield 3M", "Yield 10Y", "Credit Growth (%)", "USD/INR"]
+
+
+def compute_event_study(df_events, df_market, window=EVENT_WINDOW):
+    """Abnormal moves and cumulative pass-through around each announcement."""
+    market = df_market.sort_values("Date")
+    # Series arrive at mixed frequencies; carry each one forward so every row has a level
+    values = market[EVENT_SERIES].ffill().to_numpy(dtype=float)
+    dates = market["Date"].to_numpy()
+
+    # First market observation on/after each announcement is offset 0
+    pos = np.searchsorted(dates, df_events["Date"].to_numpy(), side="left")
+    idx = pos[:, None] + np.arange(-window, window + 1)[None, :]
+
+    # Single gather -> (events, offsets, series); offsets outside the history are missing
+    paths = values[np.clip(idx, 0, len(values) - 1)]
+    paths[(idx < 0) | (idx >= len(values))] = np.nan
+
+    # Abnormal move = period change net of the average pre-announcement drift,
+    # using only changes that are observed (zero drift if there are none)
+    changes = np.diff(paths, axis=1)
+    pre = changes[:, :window - 1]
+    pre_count = (~np.isnan(pre)).sum(axis=1)
+    drift = np.where(pre_count > 0, np.nansum(pre, axis=1) / np.maximum(pre_count, 1), 0.0)
+    abnormal = changes[:, window - 1:] - drift[:, None, :]
+    cumulative = np.cumsum(abnormal, axis=1)
+
+    n_events, n_offsets, n_series = abnormal.shape
+    profiles = pd.DataFrame({
+        "Event": np.repeat(df_events.index.to_numpy(), n_offsets * n_series),
+        "Offset": np.tile(np.repeat(np.arange(n_offsets), n_series), n_events),
+        "Series": np.tile(EVENT_SERIES, n_events * n_offsets),
+        "Abnormal Move": abnormal.ravel(),
+        "Cumulative Pass-through": cumulative.ravel()
+    }).set_index("Event")
+
+    # Full-window pass-through per announcement, then per category / impact tag
+    totals = pd.DataFrame(cumulative[:, -1, :], index=df_events.index, columns=EVENT_SERIES)
+    totals = totals.join(df_events[["Category", "Impact"]])
+
+    return {
+        "profiles": profiles,
+        "by_category": totals.groupby("Category")[EVENT_SERIES].mean(),
+        "by_impact": totals.groupby("Impact")[EVENT_SERIES].mean()
+    }
@@ -0,0 +1,287 @@
+"""Local multi-session load test for the RBI Monetary Policy Dashboard.
+
+Starts dashboard.py on a headless Streamlit server and opens N concurrent
+websocket sessions that replay analyst interactions (slider drags, category
+changes, announcement card clicks, tab switches). For every session count it
+reports p50/p95/p99 rerun latency together with server RSS and CPU.
+
+    python load_test.py --sessions 1 5 10 25 --interactions 30
+
+Tabs are rendered client-side by Streamlit, so a tab switch never reaches the
+server; it is replayed as think time only. Reruns that end in an app
+exception are counted as errors and kept out of the latency percentiles.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.py")
+INTERACTIONS = ["slider", "slider", "slider", "category", "card", "tab"]
+
+
+# -------------------- Server --------------------
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, timeout=60):
+    """Run dashboard.py headless and block until the health endpoint answers."""
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", DASHBOARD,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.address", "127.0.0.1",
+            "--browser.gatherUsageStats", "false",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.25)
+    server.kill()
+    raise RuntimeError(f"Streamlit server did not become healthy on port {port}")
+
+
+class ProcessSampler:
+    """Samples RSS and CPU of the server process from /proc (Linux)."""
+
+    def __init__(self, pid, interval=0.25):
+        self.pid = pid
+        self.interval = interval
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.peak_rss_mb = 0.0
+        self.cpu_samples = []
+
+    def _cpu_seconds(self):
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self.clock_ticks
+
+    def _rss_mb(self):
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        return 0.0
+
+    async def run(self):
+        last_cpu, last_time = self._cpu_seconds(), time.perf_counter()
+        while True:
+            await asyncio.sleep(self.interval)
+            cpu, now = self._cpu_seconds(), time.perf_counter()
+            self.cpu_samples.append(100 * (cpu - last_cpu) / (now - last_time))
+            self.peak_rss_mb = max(self.peak_rss_mb, self._rss_mb())
+            last_cpu, last_time = cpu, now
+
+
+# -------------------- Sessions --------------------
+class Session:
+    """One simulated browser tab talking the Streamlit websocket protocol."""
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.conn = None
+        self.widgets = {}
+        self.states = {}
+
+    async def connect(self):
+        self.conn = await websocket_connect(self.url, max_message_size=256 * 1024 * 1024)
+        return await self.rerun()
+
+    async def rerun(self, trigger=None):
+        """Send the current widget states and wait for the script run to finish.
+
+        Returns ``(seconds, ok)``; ``ok`` is False when the app raised an exception.
+        """
+        msg = BackMsg()
+        msg.rerun_script.widget_states.SetInParent()
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        if trigger is not None:
+            msg.rerun_script.widget_states.widgets.append(trigger)
+
+        started = time.perf_counter()
+        failed = False
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            payload = await self.conn.read_message()
+            if payload is None:
+                raise ConnectionError("Server closed the session")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(payload)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                if fwd.delta.new_element.WhichOneof("type") == "exception":
+                    failed = True
+                else:
+                    self._register(fwd.delta.new_element)
+            elif kind == "script_finished" and fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                ok = not failed and fwd.script_finished != ForwardMsg.FINISHED_WITH_COMPILE_ERROR
+                return time.perf_counter() - started, ok
+
+    def _register(self, element):
+        kind = element.WhichOneof("type")
+        widget = getattr(element, kind)
+        if "id" in widget.DESCRIPTOR.fields_by_name and widget.id:
+            self.widgets[widget.id] = (kind, widget)
+
+    def _pick(self, kind, accept=lambda widget: True):
+        ids = [wid for wid, (k, widget) in self.widgets.items() if k == kind and accept(widget)]
+        return self.rng.choice(ids) if ids else None
+
+    async def drag_slider(self):
+        """Drag a range slider's handles outward from their defaults.
+
+        The default ranges render every tab, so any superset of them still
+        leaves each filtered frame with data.
+        """
+        wid = self._pick("slider", accept=lambda slider: len(slider.default) == 2)
+        if wid is None:
+            return None
+        _, slider = self.widgets[wid]
+        steps = int(round((slider.max - slider.min) / slider.step))
+        lo_default, hi_default = (int(round((v - slider.min) / slider.step)) for v in slider.default)
+        lo, hi = self.rng.randint(0, lo_default), self.rng.randint(hi_default, steps)
+        state = WidgetState(id=wid)
+        state.double_array_value.data.extend([slider.min + lo * slider.step, slider.min + hi * slider.step])
+        self.states[wid] = state
+        return await self.rerun()
+
+    async def change_category(self):
+        wid = self._pick("selectbox")
+        if wid is None:
+            return None
+        _, selectbox = self.widgets[wid]
+        self.states[wid] = WidgetState(id=wid, int_value=self.rng.randrange(len(selectbox.options)))
+        return await self.rerun()
+
+    async def click_card(self):
+        wid = self._pick("button")
+        if wid is None:
+            return None
+        # Buttons are one-shot triggers, so they are not kept in self.states
+        return await self.rerun(trigger=WidgetState(id=wid, trigger_value=True))
+
+    async def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+async def run_session(url, n_interactions, think_time, seed):
+    """Replay one session; returns a list of ``(seconds, ok)`` per rerun."""
+    rng = random.Random(seed)
+    session = Session(url, rng)
+    reruns = []
+    try:
+        reruns.append(await session.connect())
+        actions = {"slider": session.drag_slider, "category": session.change_category, "card": session.click_card}
+        for _ in range(n_interactions):
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+            interaction = rng.choice(INTERACTIONS)
+            if interaction == "tab":
+                continue
+            result = await actions[interaction]()
+            if result is not None:
+                reruns.append(result)
+    finally:
+        await session.close()
+    return reruns
+
+
+async def run_level(url, pid, n_sessions, n_interactions, think_time, seed):
+    sampler = ProcessSampler(pid)
+    sampling = asyncio.ensure_future(sampler.run())
+    results = await asyncio.gather(*[
+        run_session(url, n_interactions, think_time, seed + i) for i in range(n_sessions)
+    ])
+    sampling.cancel()
+
+    reruns = [rerun for session in results for rerun in session]
+    latencies = np.array([seconds for seconds, ok in reruns if ok]) * 1000
+    percentile = (lambda q: np.percentile(latencies, q)) if len(latencies) else (lambda q: float("nan"))
+    return {
+        "sessions": n_sessions,
+        "reruns": len(latencies),
+        "errors": len(reruns) - len(latencies),
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "peak_rss_mb": sampler.peak_rss_mb,
+        "avg_cpu_pct": np.mean(sampler.cpu_samples) if sampler.cpu_samples else 0.0,
+    }
+
+
+# -------------------- Report --------------------
+COLUMNS = ["sessions", "reruns", "errors", "p50_ms", "p95_ms", "p99_ms", "peak_rss_mb", "avg_cpu_pct"]
+
+
+def format_row(row):
+    return "  ".join(
+        f"{row[col]:>12.1f}" if isinstance(row[col], float) else f"{row[col]:>12}" for col in COLUMNS
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session rerun latency test for dashboard.py")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25],
+                        help="concurrent session counts to test")
+    parser.add_argument("--interactions", type=int, default=20, help="interactions replayed per session")
+    parser.add_argument("--think-time", type=float, default=0.5, help="mean pause between interactions (s)")
+    parser.add_argument("--url", help="use an already running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server pid to sample when --url is given")
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        if args.pid is None:
+            parser.error("--pid is required with --url")
+        url, pid = args.url, args.pid
+    else:
+        port = free_port()
+        server = start_server(port)
+        url, pid = f"ws://127.0.0.1:{port}/_stcore/stream", server.pid
+
+    rows = []
+    try:
+        print("  ".join(f"{col:>12}" for col in COLUMNS))
+        for n_sessions in args.sessions:
+            row = asyncio.run(run_level(url, pid, n_sessions, args.interactions, args.think_time, args.seed))
+            rows.append({k: float(v) if isinstance(v, np.floating) else v for k, v in row.items()})
+            print(format_row(rows[-1]), flush=True)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.csv:
+        with open(args.csv, "w") as f:
+            f.write(",".join(COLUMNS) + "\n")
+            for row in rows:
+                f.write(",".join(str(row[col]) for col in COLUMNS) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Bridge-equation GDP nowcast over every subset of the monthly indicators.
+
+Monthly indicators are averaged to quarters and regressed on quarterly GDP
+growth. Every regressor subset (with an intercept) is fitted at every
+rolling origin from cumulative cross-product moments in one batched solve,
+and the subset with the lowest out-of-sample backtest RMSE is used for the
+quarters whose GDP has not been released yet.
+
+Each origin standardises with the moments of its own training quarters, so
+appending a released quarter is a rank-one moment update that reproduces a
+full refit exactly.
+"""
+import itertools
+import threading
+
+import numpy as np
+
+NOWCAST_REGRESSORS = ["IIP (%)", "Credit Growth (%)", "M3", "Call Rate (%)"]
+NOWCAST_RIDGE = 1e-3
+
+
+def bridge_quarters(df_monthly, regressors=NOWCAST_REGRESSORS):
+    """Quarterly GDP and quarterly means of the monthly indicators (bridge equation inputs)."""
+    quarter = df_monthly["Date"].dt.to_period("Q")
+    grouped = df_monthly.groupby(quarter)
+    return grouped[regressors].mean(), grouped["GDP Growth (%)"].last(), grouped["Date"].count()
+
+
+class BridgeNowcaster:
+    """Every regressor subset, fitted for every rolling origin from cumulative moments.
+
+    A new quarterly GDP print is a rank-one update of X'X / X'y followed by one
+    batched solve; a new monthly print only changes the current-quarter
+    regressors, so the nowcast is a single dot product with cached coefficients.
+    A spec is backtested only from origins with more quarters than parameters.
+    """
+
+    def __init__(self, regressors=NOWCAST_REGRESSORS, ridge=NOWCAST_RIDGE):
+        combos = np.array(list(itertools.product([0.0, 1.0], repeat=len(regressors))))
+        self.masks = np.hstack([np.ones((len(combos), 1)), combos])  # intercept always in
+        self.n_params = self.masks.sum(axis=1)
+        self.regressors = list(regressors)
+        self.ridge = ridge
+        self.lock = threading.Lock()
+        self.X_raw = None
+
+    @staticmethod
+    def _augment(X_raw):
+        return np.hstack([np.ones((len(X_raw), 1)), X_raw])
+
+    @staticmethod
+    def _standardizer(xx):
+        """Affine map T with [1, (x - mu) / sd] = [1, x] @ T, from the raw moments of the training quarters."""
+        n = xx[..., 0, 0, None]
+        mu = xx[..., 0, 1:] / n
+        var = np.diagonal(xx[..., 1:, 1:], axis1=-2, axis2=-1) / n - mu ** 2
+        sd = np.sqrt(np.clip(var, 0, None))
+        sd = np.where(sd > 1e-12 * np.maximum(np.abs(mu), 1), sd, 1.0)
+        T = np.zeros(xx.shape)
+        T[..., 0, 0] = 1.0
+        T[..., 0, 1:] = -mu / sd
+        k = np.arange(1, xx.shape[-1])
+        T[..., k, k] = 1 / sd
+        return T
+
+    def _solve(self, xx, xy):
+        """Ridge fit of every spec in standardised units, returned as raw-unit coefficients.
+
+        Excluded regressors get an identity row and therefore a zero coefficient.
+        """
+        T = self._standardizer(xx)
+        zz = np.swapaxes(T, -1, -2) @ xx @ T
+        zy = (np.swapaxes(T, -1, -2) @ xy[..., None])[..., 0]
+        p = self.masks.shape[1]
+        m = self.masks.reshape(len(self.masks), *[1] * (xx.ndim - 2), p)
+        A = zz[None] * m[..., :, None] * m[..., None, :] + np.eye(p) * (self.ridge * m + 1 - m)[..., None, :]
+        b = np.linalg.solve(A, (zy[None] * m)[..., None])
+        return (T[None] @ b)[..., 0]
+
+    def fit(self, X_raw, y):
+        A = self._augment(X_raw)
+        cum_xx = np.cumsum(A[:, :, None] * A[:, None, :], axis=0)
+        cum_xy = np.cumsum(A * y[:, None], axis=0)
+
+        # Origin o trains on quarters [0, o) and predicts quarter o; the last origin is the full-sample fit
+        origins = np.arange(1, len(A) + 1)
+        betas = self._solve(cum_xx[origins - 1], cum_xy[origins - 1])
+        self.backtest_index = origins[:-1]
+        predictions = np.einsum("sop,op->so", betas[:, :-1], A[origins[:-1]])
+        self.predictions = np.where(self.backtest_index[None, :] > self.n_params[:, None], predictions, np.nan)
+
+        self.beta, self.xx, self.xy = betas[:, -1], cum_xx[-1], cum_xy[-1]
+        self.X_raw, self.y = X_raw.copy(), y.copy()
+
+    def update(self, X_raw_new, y_new):
+        """Append newly released quarters without refitting the earlier origins."""
+        for x_raw, target in zip(X_raw_new, y_new):
+            a = self._augment(x_raw[None])[0]
+            origin = len(self.X_raw)
+            prediction = np.where(origin > self.n_params, self.beta @ a, np.nan)
+            self.backtest_index = np.append(self.backtest_index, origin)
+            self.predictions = np.column_stack([self.predictions, prediction])
+            self.xx = self.xx + a[:, None] * a[None, :]
+            self.xy = self.xy + a * target
+            self.beta = self._solve(self.xx, self.xy)
+            self.X_raw = np.vstack([self.X_raw, x_raw])
+            self.y = np.append(self.y, target)
+
+    def sync(self, X_raw, y):
+        """Bring the fit in line with the data, incrementally when history only grew."""
+        with self.lock:
+            n = 0 if self.X_raw is None else len(self.X_raw)
+            if n and len(X_raw) >= n and np.array_equal(X_raw[:n], self.X_raw) and np.array_equal(y[:n], self.y):
+                if len(X_raw) > n:
+                    self.update(X_raw[n:], y[n:])
+            else:
+                self.fit(X_raw, y)
+
+    def rmse(self):
+        """Backtest RMSE per spec over its valid origins; NaN for specs without any."""
+        errors = (self.predictions - self.y[self.backtest_index]) ** 2
+        count = (~np.isnan(errors)).sum(axis=1)
+        return np.where(count > 0, np.sqrt(np.nansum(errors, axis=1) / np.maximum(count, 1)), np.nan)
+
+    def nowcast(self, X_raw):
+        """Estimates for unreleased quarters (one row each) from the spec with the lowest backtest RMSE."""
+        with self.lock:
+            rmse = self.rmse()
+            best = int(np.nanargmin(rmse)) if np.isfinite(rmse).any() else int(np.argmin(self.n_params))
+            values = self._augment(X_raw) @ self.beta[best]
+            return values, best, rmse, self.predictions[best], self.backtest_index
+
+    def spec_name(self, s):
+        names = [name for name, on in zip(self.regressors, self.masks[s, 1:]) if on]
+        return " + ".join(names) if names else "Intercept only"
@@ -0,0 +1,169 @@
+"""Persistent on-disk cache for fetched series, derived metrics and fitted artifacts.
+
+Entries live in a single SQLite file keyed by (source, version, params) and
+carry the ETag / Last-Modified validators returned by the origin, so a
+refresh can ask "has this changed?" instead of re-downloading. The file is
+bounded by size and evicts least-recently-used entries first, which lets a
+fresh process warm up from disk instead of recomputing or refetching.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+DEFAULT_PATH = os.environ.get("RBI_CACHE_PATH", os.path.join(".cache", "rbi_dashboard.sqlite"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_LOG = logging.getLogger(__name__)
+_MISSING = object()  # distinguishes a miss from a cached None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key           TEXT PRIMARY KEY,
+    source        TEXT NOT NULL,
+    version       TEXT NOT NULL,
+    params        TEXT NOT NULL,
+    payload       BLOB NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    fetched_at    REAL NOT NULL,
+    accessed_at   REAL NOT NULL,
+    size          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+def fingerprint(*frames):
+    """Stable content hash of one or more DataFrames, for use in cache params."""
+    digest = hashlib.sha256()
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        digest.update(",".join(map(str, frame.columns)).encode())
+    return digest.hexdigest()
+
+
+class SeriesCache:
+    """SQLite-backed cache with conditional refresh and size-based LRU eviction."""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(source, version, params=None):
+        raw = json.dumps([source, str(version), params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _lookup(self, key):
+        return self._conn.execute(
+            "SELECT payload, etag, last_modified, fetched_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+    def get(self, source, version, params=None, default=None):
+        """Return the cached payload, or ``default`` when there is no entry."""
+        key = self.make_key(source, version, params)
+        with self._lock:
+            row = self._lookup(key)
+            if row is None:
+                return default
+            with self._conn:
+                self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, source, version, params, payload, etag=None, last_modified=None):
+        """Store a payload with its validators, then evict down to max_bytes.
+
+        Returns False (and stores nothing) when the payload alone exceeds the budget.
+        """
+        key = self.make_key(source, version, params)
+        blob = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            _LOG.warning("Not caching %s v%s: %d bytes exceeds the %d byte budget",
+                         source, version, len(blob), self.max_bytes)
+            return False
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, source, str(version), json.dumps(params or {}, sort_keys=True, default=str),
+                 blob, etag, last_modified, now, now, len(blob))
+            )
+            self._evict()
+        return True
+
+    def fetch(self, source, version, params, loader, max_age=None):
+        """Conditionally refresh an entry.
+
+        ``loader(etag, last_modified)`` must return ``(payload, etag, last_modified)``,
+        or ``None`` when the origin reports the cached copy is still current
+        (HTTP 304). Entries younger than ``max_age`` seconds are served without
+        calling the loader at all.
+        """
+        key = self.make_key(source, version, params)
+        with self._lock:
+            row = self._lookup(key)
+
+        if row is not None and max_age is not None and time.time() - row[3] < max_age:
+            return self.get(source, version, params)
+
+        result = loader(row[1], row[2]) if row is not None else loader(None, None)
+        if result is None:
+            if row is None:
+                raise ValueError(f"Loader for {source!r} reported not-modified but nothing is cached")
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                    (time.time(), time.time(), key)
+                )
+            return pickle.loads(row[0])
+
+        payload, etag, last_modified = result
+        self.put(source, version, params, payload, etag=etag, last_modified=last_modified)
+        return payload
+
+    def get_or_compute(self, source, version, params, compute):
+        """Return a cached derived artifact, computing and storing it on a miss."""
+        payload = self.get(source, version, params, default=_MISSING)
+        if payload is _MISSING:
+            payload = compute()
+            self.put(source, version, params, payload)
+        return payload
+
+    def _evict(self):
+        # Keep the most recently used entries whose running size fits the budget
+        self._conn.execute(
+            """
+            DELETE FROM entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running
+                    FROM entries
+                ) WHERE running > ?
+            )
+            """,
+            (self.max_bytes,)
+        )
+
+    def size(self):
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def invalidate(self, source, version=None):
+        """Drop every entry for a source (optionally a single version)."""
+        with self._lock, self._conn:
+            if version is None:
+                self._conn.execute("DELETE FROM entries WHERE source = ?", (source,))
+            else:
+                self._conn.execute("DELETE FROM entries WHERE source = ? AND version = ?", (source, str(version)))
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alerts import evaluate_alert_rules, scan_alerts, validate_alert_rules
+
+
+def rules(*rows):
+    return pd.DataFrame(list(rows), columns=["Rule", "Kind", "Column", "Other", "Periods", "Op", "Threshold"])
+
+
+LEVEL = {"Rule": "CPI above 6", "Kind": "level", "Column": "CPI", "Op": ">", "Threshold": 6.0}
+CHANGE = {"Rule": "Reserves down 2%", "Kind": "pct_change", "Column": "Reserves", "Periods": 1,
+          "Op": "<", "Threshold": -2.0}
+
+
+def panel(dates, cpi, reserves=None):
+    df = pd.DataFrame({"Date": pd.to_datetime(dates), "CPI": cpi})
+    df["Reserves"] = reserves if reserves is not None else np.nan
+    return df
+
+
+def test_pct_change_lags_over_the_series_own_observations():
+    # Weekly reserves on a panel whose other rows are month-ends
+    df = panel(["2023-01-06", "2023-01-13", "2023-01-31", "2023-02-03"], [5.0, np.nan, 5.1, np.nan],
+               [100.0, 99.0, np.nan, 96.0])
+
+    operand, breached = evaluate_alert_rules(df.drop(columns="Date"), rules(CHANGE))
+
+    np.testing.assert_allclose(operand[:, 0], [np.nan, -1.0, np.nan, (96 / 99 - 1) * 100])
+    np.testing.assert_array_equal(breached[:, 0], [np.nan, 0.0, np.nan, 1.0])
+
+
+@pytest.mark.parametrize("periods", [np.nan, 0, -1, 1.5])
+def test_pct_change_rules_need_positive_integer_periods(periods):
+    df = panel(["2023-01-31"], [5.0])
+    with pytest.raises(ValueError, match="Periods"):
+        validate_alert_rules(df.drop(columns="Date"), rules({**CHANGE, "Periods": periods}))
+
+
+def test_unknown_columns_are_rejected():
+    df = panel(["2023-01-31"], [5.0])
+    with pytest.raises(ValueError, match="CPl"):
+        validate_alert_rules(df.drop(columns="Date"), rules({**LEVEL, "Column": "CPl"}))
+
+
+def test_alerts_fire_on_rising_edges_only():
+    df = panel(pd.date_range("2023-01-31", periods=5, freq="ME"), [6.5, 6.6, 5.0, 6.2, 6.3])
+
+    state, fired = scan_alerts(df, rules(LEVEL))
+
+    assert [alert["Date"].month for alert in fired] == [1, 4]
+    assert state["active"]["CPI above 6"]
+
+
+def test_incremental_scan_matches_a_full_scan():
+    df = panel(pd.date_range("2023-01-31", periods=6, freq="ME"), [5.0, 6.5, 5.0, 5.5, 6.2, 6.4])
+
+    state, _ = scan_alerts(df.iloc[:3], rules(LEVEL))
+    state, fired = scan_alerts(df, rules(LEVEL), state)
+    full, _ = scan_alerts(df, rules(LEVEL))
+
+    assert [alert["Date"].month for alert in fired] == [5]
+    assert state["alerts"] == full["alerts"]
+    assert scan_alerts(df, rules(LEVEL), state)[0] is state
+
+
+def test_backfilled_history_is_re_evaluated_from_scratch():
+    sample = panel(pd.date_range("2023-01-31", periods=3, freq="ME"), [6.5, 6.5, 6.5])
+    state, _ = scan_alerts(sample, rules(LEVEL))
+
+    backfill = panel(pd.date_range("2022-01-31", periods=18, freq="ME"), [5.0, 7.0] * 9)
+    state, fired = scan_alerts(backfill, rules(LEVEL), state)
+
+    assert len(fired) == 9
+    assert fired[0]["Date"] == pd.Timestamp("2022-02-28")
+    assert state["alerts"] == fired
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from dbie_import import import_file, read_chunks, read_history
+
+
+@pytest.mark.parametrize("dates", [
+    ["2023-01-05", "2023-02-06", "2023-12-01"],
+    ["05-01-2023", "06-02-2023", "01-12-2023"],
+    ["05/01/2023", "06/02/2023", "01/12/2023"],
+])
+def test_import_parses_iso_and_day_first_dates(tmp_path, dates):
+    source = tmp_path / "export.csv"
+    pd.DataFrame({"Date": dates, "Repo Rate": [6.25, 6.5, 6.5], "Reverse Repo Rate": 3.35,
+                  "CRR": 4.5, "SLR": 18.0}).to_csv(source, index=False)
+    db = tmp_path / "history.sqlite"
+
+    import_file(str(source), db_path=str(db), report=lambda *args: None)
+
+    history = read_history("policy_rates", str(db))
+    assert list(history["Date"].dt.strftime("%Y-%m-%d")) == ["2023-01-05", "2023-02-06", "2023-12-01"]
+    assert list(history["Repo Rate"]) == [6.25, 6.5, 6.5]
+
+
+def test_unparseable_dates_are_rejected(tmp_path):
+    source = tmp_path / "export.csv"
+    pd.DataFrame({"Date": ["Q1", "Q2", "2023-03-31"], "Repo Rate": [6.5, 6.5, 6.5]}).to_csv(source, index=False)
+
+    with pytest.raises(ValueError, match="--date-format"):
+        import_file(str(source), db_path=str(tmp_path / "history.sqlite"), report=lambda *args: None)
+
+
+def test_cpi_subgroups_map_by_sector(tmp_path):
+    source = tmp_path / "export.csv"
+    pd.DataFrame({"Date": ["2023-01-31"], "Rural Cereals and products": [5.1], "Cereals and products Urban": [4.2],
+                  "CPI Combined Housing": [4.6]}).to_csv(source, index=False)
+    db = tmp_path / "history.sqlite"
+
+    import_file(str(source), db_path=str(db), report=lambda *args: None)
+
+    history = read_history("cpi_basket", str(db)).iloc[0]
+    assert (history["Rural: Cereals and products"], history["Urban: Cereals and products"],
+            history["Combined: Housing"]) == (5.1, 4.2, 4.6)
+    assert "Rural: Housing" not in history
+
+
+def test_legacy_xls_is_rejected():
+    with pytest.raises(ValueError, match=".xls"):
+        next(read_chunks("export.xls", chunksize=10))
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from event_study import EVENT_SERIES, compute_event_study
+
+
+def market(dates, levels):
+    return pd.DataFrame({"Date": pd.to_datetime(dates), **{series: levels for series in EVENT_SERIES}})
+
+
+def events(dates, categories, impacts):
+    return pd.DataFrame({"Date": pd.to_datetime(dates), "Category": categories, "Impact": impacts})
+
+
+def test_abnormal_move_is_net_of_pre_announcement_drift():
+    dates = pd.date_range("2023-01-31", periods=8, freq="ME")
+    levels = [1.0, 2.0, 3.0, 4.0, 6.0, 7.0, 8.0, 9.0]  # +1 drift, one +2 jump into May
+    result = compute_event_study(events(["2023-04-15"], ["Policy Rate"], ["Increase"]),
+                                 market(dates, levels), window=2)
+
+    profile = result["profiles"].loc[[0]]
+    moves = profile[profile["Series"] == "Call Rate (%)"]["Abnormal Move"].to_numpy()
+    np.testing.assert_allclose(moves, [0.0, 1.0, 0.0])
+    assert result["by_category"].loc["Policy Rate", "USD/INR"] == 1.0
+
+
+def test_offsets_before_history_are_missing_not_flat():
+    dates = pd.date_range("2023-01-31", periods=6, freq="ME")
+    result = compute_event_study(
+        events(["2023-01-01", "2023-03-15"], ["Policy Rate", "Policy Rate"], ["Increase", "Neutral"]),
+        market(dates, [1.0, 2.0, 3.0, 5.0, 6.0, 7.0]), window=2
+    )
+
+    profile = result["profiles"].loc[[0]]
+    assert profile.loc[profile["Offset"] == 0, "Abnormal Move"].isna().all()
+    assert profile["Cumulative Pass-through"].isna().all()
+    # The announcement without pre-event data drops out of the averages
+    assert result["by_impact"].loc["Increase"].isna().all()
+    assert result["by_category"].loc["Policy Rate", "Yield 10Y"] == result["by_impact"].loc["Neutral", "Yield 10Y"]
+
+
+def test_mixed_frequency_series_are_carried_forward():
+    dates = pd.date_range("2023-01-31", periods=6, freq="ME")
+    df_market = market(dates, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    df_market.loc[[1, 3], "USD/INR"] = np.nan  # observed every other month
+
+    result = compute_event_study(events(["2023-03-15"], ["Liquidity"], ["Positive"]), df_market, window=2)
+
+    assert result["profiles"]["Cumulative Pass-through"].notna().all()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from nowcast import BridgeNowcaster, bridge_quarters
+
+
+def synthetic(n=16, seed=0):
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([rng.normal(5, 2, n), rng.normal(12, 1, n), rng.normal(2e5, 5e3, n), rng.normal(6.5, 0.2, n)])
+    y = 1.0 + 0.4 * X[:, 0] + rng.normal(0, 0.1, n)
+    return X, y
+
+
+def test_incremental_sync_matches_a_full_fit():
+    X, y = synthetic()
+    incremental = BridgeNowcaster()
+    incremental.sync(X[:8], y[:8])
+    incremental.sync(X, y)
+    full = BridgeNowcaster()
+    full.fit(X, y)
+
+    np.testing.assert_array_equal(incremental.backtest_index, full.backtest_index)
+    np.testing.assert_allclose(incremental.predictions, full.predictions, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(incremental.beta, full.beta, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(incremental.rmse(), full.rmse(), rtol=1e-9)
+
+
+def test_excluded_regressors_get_zero_coefficients():
+    X, y = synthetic()
+    model = BridgeNowcaster()
+    model.fit(X, y)
+
+    excluded = model.masks == 0
+    np.testing.assert_allclose(model.beta[excluded], 0.0, atol=1e-12)
+    assert np.all(model.beta[~excluded] != 0)
+
+
+def test_specs_are_backtested_only_with_more_quarters_than_parameters():
+    X, y = synthetic(n=8)
+    model = BridgeNowcaster()
+    model.fit(X, y)
+
+    first = [model.backtest_index[~np.isnan(row)].min() for row in model.predictions]
+    np.testing.assert_array_equal(first, model.n_params + 1)
+
+
+def test_nowcast_picks_the_true_spec():
+    X, y = synthetic()
+    model = BridgeNowcaster()
+    model.fit(X[:-1], y[:-1])
+
+    values, best, rmse, _, _ = model.nowcast(X[-1:])
+
+    assert model.spec_name(best) == "IIP (%)"
+    assert abs(values[0] - (1.0 + 0.4 * X[-1, 0])) < 0.3
+
+
+def test_bridge_quarters_leave_unreleased_gdp_missing():
+    df = pd.DataFrame({
+        "Date": pd.date_range("2023-01-31", periods=5, freq="ME"),
+        "GDP Growth (%)": [np.nan, np.nan, 6.1, np.nan, np.nan],
+        "IIP (%)": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "Credit Growth (%)": 12.0, "M3": 2e5, "Call Rate (%)": 6.5,
+    })
+
+    X_q, y_q, months = bridge_quarters(df)
+
+    assert list(X_q["IIP (%)"]) == [2.0, 4.5]
+    assert y_q.iloc[0] == 6.1 and np.isnan(y_q.iloc[1])
+    assert list(months) == [3, 2]
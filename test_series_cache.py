@@ -0,0 +1,89 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+import series_cache
+from series_cache import SeriesCache, fingerprint
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time so LRU order does not depend on timer resolution."""
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(series_cache.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return SeriesCache(str(tmp_path / "cache.sqlite"), max_bytes=2500)
+
+
+def test_cached_none_is_a_hit(cache):
+    missing = object()
+    assert cache.get("rates", 1, default=missing) is missing
+
+    cache.put("rates", 1, None, None)
+    assert cache.get("rates", 1, default=missing) is None
+
+    calls = []
+    assert cache.get_or_compute("rates", 1, None, lambda: calls.append(1)) is None
+    assert calls == []
+
+
+def test_oversize_payload_is_refused(cache):
+    assert cache.put("big", 1, None, b"x" * 5000) is False
+    assert cache.get("big", 1, default="miss") == "miss"
+    assert cache.size() == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    for name in ["a", "b"]:
+        cache.put(name, 1, None, b"x" * 1000)
+    cache.get("a", 1)  # a is now more recent than b
+
+    cache.put("c", 1, None, b"x" * 1000)
+
+    assert cache.get("b", 1, default="miss") == "miss"
+    assert cache.get("a", 1) == cache.get("c", 1) == b"x" * 1000
+    assert cache.size() <= cache.max_bytes
+
+
+def test_fetch_revalidates_with_stored_validators(cache):
+    seen = []
+
+    def loader(etag, last_modified):
+        seen.append((etag, last_modified))
+        return None if etag else ("v1", '"abc"', "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    assert cache.fetch("forex", 1, {"series": "USD"}, loader) == "v1"
+    assert cache.fetch("forex", 1, {"series": "USD"}, loader) == "v1"  # 304 -> cached copy
+    assert seen == [(None, None), ('"abc"', "Mon, 01 Jan 2024 00:00:00 GMT")]
+
+
+def test_fetch_within_max_age_skips_the_loader(cache):
+    cache.put("forex", 1, None, "cached")
+    assert cache.fetch("forex", 1, None, loader=pytest.fail, max_age=3600) == "cached"
+
+
+def test_not_modified_without_a_cached_copy_is_an_error(cache):
+    with pytest.raises(ValueError, match="not-modified"):
+        cache.fetch("forex", 1, None, lambda etag, last_modified: None)
+
+
+def test_invalidate_drops_one_version_or_the_whole_source(cache):
+    for version in [1, 2]:
+        cache.put("nowcast", version, None, version)
+
+    cache.invalidate("nowcast", 1)
+    assert cache.get("nowcast", 1) is None and cache.get("nowcast", 2) == 2
+
+    cache.invalidate("nowcast")
+    assert cache.size() == 0
+
+
+def test_fingerprint_tracks_content_and_columns():
+    df = pd.DataFrame({"Date": pd.date_range("2023-01-31", periods=3, freq="ME"), "CPI": [5.0, 5.1, 5.2]})
+    assert fingerprint(df) == fingerprint(df.copy())
+    assert fingerprint(df) != fingerprint(df.assign(CPI=[5.0, 5.1, 5.3]))
+    assert fingerprint(df) != fingerprint(df.rename(columns={"CPI": "WPI"}))